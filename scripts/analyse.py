@@ -3,32 +3,21 @@
 # ================================================================
 
 import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+import numpy as np
 import pandas as pd
-import nltk
-from nltk.sentiment.vader import SentimentIntensityAnalyzer # will call sia later on
 
-# ================================================================
-#   Logging
-#               Sources:
-#               https://docs.python.org/3/library/logging.html
-#               https://docs.python.org/3/howto/logging.html
-# ================================================================
-def setup_logging(output_dir: Path, logs_dir: Path = None, level=logging.INFO):
-    out_dir = Path(output_dir)
-    out_dir.mkdir(parents=True, exist_ok=True)
-    if logs_dir is None:
-        logs_dir = out_dir / "logs"
-    logs_dir = Path(logs_dir)
-    logs_dir.mkdir(parents=True, exist_ok=True)
-    log_file = logs_dir / "pipeline.log"
-    handlers = [logging.FileHandler(log_file, encoding="utf-8"), logging.StreamHandler()]
-    logging.basicConfig(level=level, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s", handlers=handlers)
+from logging_setup import setup_logging
 
 # ================================================================
 #   VADER: ensure lexicon is there
 # ================================================================
 def ensure_vader():
+    # nltk is imported lazily; it's slow to load and only needed for scoring
+    import nltk
     try:
         _ = nltk.data.find("sentiment/vader_lexicon")
     except LookupError:
@@ -39,32 +28,115 @@ def ensure_vader():
 #               Sources:
 #                https://www.geeksforgeeks.org/python/python-sentiment-analysis-using-vader/
 # ================================================================
-def label_sentiment(compound: float) -> str:
-    if compound >= 0.05:
-        return "Positive"
-    if compound <= -0.05:
-        return "Negative"
-    return "Neutral"
+# One analyser per process: building it parses the whole lexicon, so it is
+# created on first use and reused across calls (and streaming chunks).
+# Large inputs are scored on a worker pool that is also created once and
+# reused; small inputs are scored in-process since the pool wouldn't pay off.
+_SIA = None
+_EXECUTOR = None
+_POOL_WORKERS = os.cpu_count() or 1
+_PARALLEL_MIN_ROWS = 5000
+# Retweets and boilerplate repeat a lot, so duplicate texts are scored once.
+# The cache (in this process and in each pool worker) is kept across
+# run_vader calls so streaming chunks share it, and can hold a lot of memory
+# when full; call clear_score_cache() when done
+_SCORE_CACHE_SIZE = 200_000
+# Compound score cut-offs for the Positive/Negative labels
+POSITIVE_THRESHOLD = 0.05
+NEGATIVE_THRESHOLD = -0.05
+
+def _get_sia():
+    global _SIA
+    if _SIA is None:
+        ensure_vader()
+        from nltk.sentiment.vader import SentimentIntensityAnalyzer
+        _SIA = SentimentIntensityAnalyzer()
+    return _SIA
+
+def _init_worker():
+    _get_sia()
+
+def _get_executor() -> ProcessPoolExecutor:
+    global _EXECUTOR
+    if _EXECUTOR is None:
+        _EXECUTOR = ProcessPoolExecutor(max_workers=_POOL_WORKERS, initializer=_init_worker)
+    return _EXECUTOR
+
+@lru_cache(maxsize=_SCORE_CACHE_SIZE)
+def _score(text: str) -> dict:
+    return _get_sia().polarity_scores(text)
+
+# Also shuts down the worker pool, which drops the workers' caches
+def clear_score_cache():
+    global _EXECUTOR
+    _score.cache_clear()
+    if _EXECUTOR is not None:
+        _EXECUTOR.shutdown()
+        _EXECUTOR = None
 
+# Adds columns to df in place (no defensive copy) and returns it
 def run_vader(df: pd.DataFrame, text_col: str = "processed_text") -> pd.DataFrame:
     ensure_vader()
-    sia = SentimentIntensityAnalyzer()
-    df = df.copy()
     df[text_col] = df[text_col].fillna("").astype(str)
-    df["vader_scores"] = df[text_col].apply(lambda x: sia.polarity_scores(x))
-    df[["neg", "neu", "pos", "compound"]] = df["vader_scores"].apply(pd.Series)
+    texts = df[text_col].tolist()
+    # A pool only pays off with more than one core
+    if len(texts) >= _PARALLEL_MIN_ROWS and _POOL_WORKERS > 1:
+        # A few tasks per worker keeps them all busy without much IPC overhead
+        chunksize = max(1, len(texts) // (_POOL_WORKERS * 4))
+        scores = list(_get_executor().map(_score, texts, chunksize=chunksize))
+    else:
+        scores = [_score(t) for t in texts]
+    score_cols = ["neg", "neu", "pos", "compound"]
+    # VADER rounds to at most 4 decimals, so float32 loses nothing (pandas
+    # writes float32 in shortest form, e.g. 0.4404)
+    df[score_cols] = pd.DataFrame(scores, index=df.index, columns=score_cols).astype(np.float32)
     df["compound"] = df["compound"].fillna(0.0)
-    df["sentiment"] = df["compound"].apply(label_sentiment)
+    c = df["compound"].to_numpy()
+    labels = np.where(c >= POSITIVE_THRESHOLD, "Positive", np.where(c <= NEGATIVE_THRESHOLD, "Negative", "Neutral"))
+    # Only three labels, so store them as categorical codes rather than strings
+    df["sentiment"] = pd.Categorical(labels, categories=["Positive", "Neutral", "Negative"])
     return df
 
+# ================================================================
+#   CSV output
+#               Sources:
+#               https://arrow.apache.org/docs/python/csv.html
+#   Note:
+#       pyarrow is optional; without it, or when Arrow can't convert or
+#       write a column (e.g. list/dict fields), this falls back to pandas'
+#       to_csv. Arrow's output is not byte-identical to pandas': it quotes
+#       every string value and header and writes whole floats as "0", so
+#       it differs in format from the streaming CSV (always pandas).
+#       Both parse back to the same data with pd.read_csv
+# ================================================================
+def save_csv(df: pd.DataFrame, out_path: Path):
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pacsv
+    except ImportError:
+        df.to_csv(out_path, index=False, encoding="utf-8")
+        return
+
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        # Write categorical columns (e.g. sentiment) as their plain labels
+        for i, field in enumerate(table.schema):
+            if pa.types.is_dictionary(field.type):
+                table = table.set_column(i, field.name, table.column(i).cast(pa.string()))
+        pacsv.write_csv(table, out_path)
+    except pa.ArrowException:
+        logging.getLogger(__name__).debug("pyarrow could not write frame; using pandas to_csv")
+        Path(out_path).unlink(missing_ok=True)
+        df.to_csv(out_path, index=False, encoding="utf-8")
+
 # ================================================================
 #   CLI + Main execution logic
 #   Sources:
 #       https://docs.python.org/3/library/argparse.html
 #       https://realpython.com/command-line-interfaces-python-argparse/
 #   Note:
-#       This doesn't follow DRY principle so each file can be run independently
-#       Allows for standalone execution for testing and modular use
+#       Each file keeps its own CLI so it can be run on its own for testing
+#       and modular use; they only share logging setup (logging_setup.py)
 # ================================================================
 if __name__ == "__main__":
     import argparse
@@ -93,9 +165,10 @@ if __name__ == "__main__":
         df = pd.read_csv(args.input)
         logger.info("loaded %d rows for analysis", len(df))
         df_result = run_vader(df)
+        clear_score_cache()
         out = Path(args.output)
         out.parent.mkdir(parents=True, exist_ok=True)
-        df_result.to_csv(out, index=False, encoding="utf-8")
+        save_csv(df_result, out)
         logger.info("saved analysed csv to %s", out)
     except Exception as e:
         logger.exception("analysis failed: %s", e)
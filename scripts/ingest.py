@@ -2,33 +2,24 @@
 #   ingest.py
 # ================================================================
 
-import json
 import time
 from pathlib import Path
 from typing import Generator, Dict
 import logging
 
-# ================================================================
-#   Logging
-#               Sources:
-#               https://docs.python.org/3/library/logging.html
-#               https://docs.python.org/3/howto/logging.html
-# ================================================================
-def setup_logging(output_dir: Path, logs_dir: Path = None, level=logging.INFO):
-    out_dir = Path(output_dir)
-    out_dir.mkdir(parents=True, exist_ok=True)
-    if logs_dir is None:
-        logs_dir = out_dir / "logs"
-    logs_dir = Path(logs_dir)
-    logs_dir.mkdir(parents=True, exist_ok=True)
-    log_file = logs_dir / "pipeline.log"
-    handlers = [logging.FileHandler(log_file, encoding="utf-8"), logging.StreamHandler()]
-    logging.basicConfig(level=level, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s", handlers=handlers)
+from logging_setup import setup_logging
+
+# orjson is optional, stdlib json is the fallback; both parse bytes directly
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
 
 # ================================================================
 #   Read and stream .jsonl
 #               Sources:
 #               https://docs.python.org/3/library/json.html
+#               https://github.com/ijl/orjson
 #               https://realpython.com/python-generators/
 # ================================================================
 def read_jsonl(path: Path) -> Generator[Dict, None, None]:
@@ -39,14 +30,13 @@ def read_jsonl(path: Path) -> Generator[Dict, None, None]:
     logger = logging.getLogger(__name__)
     valid_count = 0
     # Parse the json file. If broken warn, skip and move!
-    with path.open("r", encoding="utf-8") as f:
+    with path.open("rb") as f:
         for i, line in enumerate(f, 1):
-            line = line.strip()
-            if not line:
+            if not line.strip():
                 continue
             try:
-                obj = json.loads(line)
-            except json.JSONDecodeError:
+                obj = _json.loads(line)
+            except ValueError:  # JSONDecodeError or bad utf-8
                 logger.warning("Skipping invalid JSON on line %d", i)
                 continue
 
@@ -62,6 +52,10 @@ def read_jsonl(path: Path) -> Generator[Dict, None, None]:
 
     # Allow for live data
 def stream_jsonl(path: Path, chunk_size: int = 1, delay: float = 0.0) -> Generator[Dict, None, None]:
+    # Without a delay, chunking doesn't change what is yielded, so skip the buffer
+    if delay <= 0:
+        yield from read_jsonl(path)
+        return
     buf = []
     for obj in read_jsonl(path):
         buf.append(obj)
@@ -69,8 +63,7 @@ def stream_jsonl(path: Path, chunk_size: int = 1, delay: float = 0.0) -> Generat
             for o in buf:
                 yield o
             buf = []
-            if delay > 0:
-                time.sleep(delay)
+            time.sleep(delay)
     for o in buf:
         yield o
 
@@ -80,8 +73,8 @@ def stream_jsonl(path: Path, chunk_size: int = 1, delay: float = 0.0) -> Generat
 #       https://docs.python.org/3/library/argparse.html
 #       https://realpython.com/command-line-interfaces-python-argparse/
 #   Note:
-#       This doesn't follow DRY principle so each file can be run independently
-#       Allows for standalone execution for testing and modular use
+#       Each file keeps its own CLI so it can be run on its own for testing
+#       and modular use; they only share logging setup (logging_setup.py)
 # ================================================================
 if __name__ == "__main__":
     import argparse
@@ -0,0 +1,31 @@
+# ================================================================
+#   logging_setup.py
+# ================================================================
+
+from pathlib import Path
+import logging
+
+# ================================================================
+#   Logging
+#               Sources:
+#               https://docs.python.org/3/library/logging.html
+#               https://docs.python.org/3/howto/logging.html
+#   Note:
+#       Shared by every script. If the root logger is already set up
+#       only the level is updated, so repeat calls don't open another
+#       FileHandler on pipeline.log
+# ================================================================
+def setup_logging(output_dir: Path, logs_dir: Path = None, level=logging.INFO):
+    root = logging.getLogger()
+    if root.handlers:
+        root.setLevel(level)
+        return
+    out_dir = Path(output_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    if logs_dir is None:
+        logs_dir = out_dir / "logs"
+    logs_dir = Path(logs_dir)
+    logs_dir.mkdir(parents=True, exist_ok=True)
+    log_file = logs_dir / "pipeline.log"
+    handlers = [logging.FileHandler(log_file, encoding="utf-8"), logging.StreamHandler()]
+    logging.basicConfig(level=level, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s", handlers=handlers)
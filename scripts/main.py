@@ -7,10 +7,11 @@ import logging
 from pathlib import Path
 import pandas as pd
 
-from ingest import stream_jsonl, setup_logging as ingest_setup_logging
-from preprocess import df_preprocess, setup_logging as preprocess_setup_logging
-from analyse import run_vader, setup_logging as analyse_setup_logging
-from visualise import run_visualisations, setup_logging as visualise_setup_logging
+from logging_setup import setup_logging
+from ingest import stream_jsonl
+from preprocess import df_preprocess
+from analyse import run_vader, save_csv, clear_score_cache
+from visualise import run_visualisations
 
 # ================================================================
 #   Pipeline orchestration
@@ -20,11 +21,7 @@ from visualise import run_visualisations, setup_logging as visualise_setup_loggi
 # ================================================================
 def setup_all_logs(outdir: Path, logdir: Path, verbose: bool = False):
     level = logging.DEBUG if verbose else logging.INFO
-    ingest_setup_logging(outdir, logs_dir=logdir, level=level)
-    preprocess_setup_logging(outdir, logs_dir=logdir, level=level)
-    analyse_setup_logging(outdir, logs_dir=logdir, level=level)
-    visualise_setup_logging(outdir, logs_dir=logdir, level=level)
-    logging.getLogger().setLevel(level)
+    setup_logging(outdir, logs_dir=logdir, level=level)
 
 # ================================================================
 #   Summary report generator
@@ -49,11 +46,58 @@ def generate_summary_report(df: pd.DataFrame, outdir: Path):
         f.write(f"\nAverage compound score: {avg_compound:.4f}\n")
         f.write("="*40 + "\n")
 
+# ================================================================
+#   Batch loading
+#               Sources:
+#               https://pandas.pydata.org/docs/reference/api/pandas.read_json.html
+# ================================================================
+def load_batch(input_path: Path) -> pd.DataFrame:
+    logger = logging.getLogger("pipeline")
+    input_path = Path(input_path)
+    if not input_path.exists():
+        raise FileNotFoundError(input_path)
+    try:
+        # Keep timestamps as the raw strings, same as the streaming path, and
+        # parse floats exactly so passthrough fields match json.loads
+        df = pd.read_json(input_path, lines=True, dtype=False, convert_dates=False, precise_float=True)
+    except ValueError:
+        # Malformed lines: fall back to ingest, which skips them one at a time
+        logger.warning("pandas could not parse %s; falling back to line-by-line ingest", input_path)
+        return pd.DataFrame(list(stream_jsonl(input_path)))
+
+    if not {"text", "timestamp"}.issubset(df.columns):
+        logger.warning("No valid records found in file: %s", input_path)
+        return df.iloc[0:0]
+    # Same rule as read_jsonl: drop rows whose text or timestamp is missing or falsy
+    keep = (df["text"].notna() & df["text"].astype(bool)
+            & df["timestamp"].notna() & df["timestamp"].astype(bool))
+    dropped = int((~keep).sum())
+    if dropped:
+        logger.warning("Skipping %d records: missing 'text' or 'timestamp'", dropped)
+    df = df[keep]
+    if df.empty:
+        logger.warning("No valid records found in file: %s", input_path)
+    return df.reset_index(drop=True)
+
+# ================================================================
+#   Streaming chunks
+# ================================================================
+def iter_chunks(records, chunk_size: int):
+    buffer = []
+    for obj in records:
+        buffer.append(obj)
+        if len(buffer) >= chunk_size:
+            yield buffer
+            buffer = []
+    # Leftover messages that didn't fill a whole chunk
+    if buffer:
+        yield buffer
+
 # ================================================================
 #   The main pipeline
 # ================================================================
 
-def run_pipeline(input_path: Path, outdir: Path, logdir: Path, simulate: bool = False, chunk_size: int = 1, delay: float = 0.0, verbose: bool = False):
+def run_pipeline(input_path: Path, outdir: Path, logdir: Path, simulate: bool = False, chunk_size: int = 1, delay: float = 0.0, verbose: bool = False, viz_every: int = 50):
     outdir = Path(outdir)
     outdir.mkdir(parents=True, exist_ok=True)
     logdir = Path(logdir)
@@ -64,36 +108,48 @@ def run_pipeline(input_path: Path, outdir: Path, logdir: Path, simulate: bool =
 
     if not simulate:
         logger.info("running pipeline (batch)")
-        rows = [obj for obj in stream_jsonl(input_path, chunk_size=chunk_size, delay=0.0)]
-        df = pd.DataFrame(rows)
+        df = load_batch(input_path)
         logger.info("loaded %d rows from ingest", len(df))
         df_processed = df_preprocess(df)
         df_analysed = run_vader(df_processed)
+        clear_score_cache()
 
         generate_summary_report(df_analysed, outdir)
 
-        df_analysed.to_csv(csv_out, index=False, encoding="utf-8")
+        save_csv(df_analysed, csv_out)
         run_visualisations(df_analysed, outdir)
         logger.info("batch pipeline complete. outputs: %s", outdir)
     else:
         logger.info("running pipeline (simulated streaming)")
-        buffer = []
-        for obj in stream_jsonl(input_path, chunk_size=chunk_size, delay=delay):
-            buffer.append(obj)
-            if len(buffer) >= chunk_size:
+        # Analysed chunks are kept in memory so the CSV is never read back
+        accum = []
+        drawn = 0  # number of chunks in the last plot refresh
+        # One buffered handle for the whole run instead of reopening the CSV per chunk.
+        # It's opened on the first chunk so a run with no records leaves old results alone
+        fh = None
+        try:
+            for buffer in iter_chunks(stream_jsonl(input_path, chunk_size=chunk_size, delay=delay), chunk_size):
                 df_chunk = pd.DataFrame(buffer)
                 df_proc = df_preprocess(df_chunk)
                 df_analysed = run_vader(df_proc)
-                if csv_out.exists():
-                    df_analysed.to_csv(csv_out, mode="a", header=False, index=False, encoding="utf-8")
-                else:
-                    df_analysed.to_csv(csv_out, mode="w", header=True, index=False, encoding="utf-8")
-                df_full = pd.read_csv(csv_out)
+                if fh is None:
+                    fh = open(csv_out, "w", buffering=1 << 20, encoding="utf-8", newline="")
+                df_analysed.to_csv(fh, header=not accum, index=False)
+                accum.append(df_analysed)
+                # Redrawing every chunk makes plotting O(N^2); refresh every viz_every chunks
+                if viz_every > 0 and len(accum) % viz_every == 0:
+                    fh.flush()
+                    run_visualisations(pd.concat(accum, ignore_index=True), outdir)
+                    drawn = len(accum)
+        finally:
+            if fh is not None:
+                fh.close()
+
+        clear_score_cache()
+        if accum:
+            df_full = pd.concat(accum, ignore_index=True)
+            if drawn != len(accum):
                 run_visualisations(df_full, outdir)
-                buffer = []
-
-        if csv_out.exists():
-            df_full = pd.read_csv(csv_out)
             generate_summary_report(df_full, outdir)
 
         logger.info("streaming pipeline finished. outputs: %s", outdir)
@@ -104,8 +160,8 @@ def run_pipeline(input_path: Path, outdir: Path, logdir: Path, simulate: bool =
 #       https://docs.python.org/3/library/argparse.html
 #       https://realpython.com/command-line-interfaces-python-argparse/
 #   Notes:
-#       This doesn't follow DRY principle so each file can be run independently
-#       Allows for standalone execution for testing and modular use
+#       Each file keeps its own CLI so it can be run on its own for testing
+#       and modular use; they only share logging setup (logging_setup.py)
 # ================================================================
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Run sentiment pipeline")
@@ -120,6 +176,7 @@ if __name__ == "__main__":
     parser.add_argument("--simulate", action="store_true", help="Simulate streaming ingestion")
     parser.add_argument("--chunk-size", type=int, default=1)
     parser.add_argument("--delay", type=float, default=0.0)
+    parser.add_argument("--viz-every", type=int, default=50, help="Redraw plots every N chunks when streaming (0 = only at the end)")
     parser.add_argument("--verbose", action="store_true")
     args = parser.parse_args()
 
@@ -130,5 +187,6 @@ if __name__ == "__main__":
         simulate=args.simulate,
         chunk_size=args.chunk_size,
         delay=args.delay,
-        verbose=args.verbose
+        verbose=args.verbose,
+        viz_every=args.viz_every
   )
\ No newline at end of file
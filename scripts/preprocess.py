@@ -3,60 +3,57 @@
 # ================================================================
 
 import json
+import re
 import string
-from pathlib import Path
 import logging
 import pandas as pd
-import nltk
-from nltk.corpus import stopwords
 
-# ================================================================
-#   Logging
-#               Sources:
-#               https://docs.python.org/3/library/logging.html
-#               https://docs.python.org/3/howto/logging.html
-# ================================================================
-def setup_logging(output_dir: Path, logs_dir: Path = None, level=logging.INFO):
-    out_dir = Path(output_dir)
-    out_dir.mkdir(parents=True, exist_ok=True)
-    if logs_dir is None:
-        logs_dir = out_dir / "logs"
-    logs_dir = Path(logs_dir)
-    logs_dir.mkdir(parents=True, exist_ok=True)
-    log_file = logs_dir / "pipeline.log"
-    handlers = [logging.FileHandler(log_file, encoding="utf-8"), logging.StreamHandler()]
-    logging.basicConfig(level=level, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s", handlers=handlers)
+from logging_setup import setup_logging
 
 # ================================================================
 #   NLTK: ensure stopwords is there
 # ================================================================
 def ensure_nltk_stopwords():
+    # nltk is imported lazily; it's slow to load and only needed here
+    import nltk
+    from nltk.corpus import stopwords
     try:
         stopwords.words("english")
     except LookupError:
         nltk.download("stopwords")
 
+# Built once on first use rather than per row
+_STOPWORDS = None
+# ASCII punctuation except ! ? and ' (VADER uses those), removed in a single regex pass
+_PUNCT_RE = re.compile("[" + re.escape("".join(p for p in string.punctuation if p not in "!?'")) + "]")
+
+def _get_stopwords() -> frozenset:
+    global _STOPWORDS
+    if _STOPWORDS is None:
+        ensure_nltk_stopwords()
+        from nltk.corpus import stopwords
+        _STOPWORDS = frozenset(stopwords.words("english"))
+    return _STOPWORDS
+
 # ================================================================
 #   Preprocessing for VADER
 # ================================================================
 def preprocess_text_vader(text: str) -> str:
     if not isinstance(text, str):
         return ""
-    text = text.lower()
-    punct_to_remove = ''.join([p for p in string.punctuation if p not in ["!", "?", "'"]])
-    text = text.translate(str.maketrans("", "", punct_to_remove))
-    tokens = text.split()
-    tokens = [t for t in tokens if t not in stopwords.words("english")]
-    return " ".join(tokens)
+    stop = _get_stopwords()
+    return " ".join(t for t in _PUNCT_RE.sub("", text.lower()).split() if t not in stop)
 
+# Adds columns to df in place (no defensive copy) and returns it
 def df_preprocess(df: pd.DataFrame, text_col: str = "text") -> pd.DataFrame:
-    ensure_nltk_stopwords()
-    df = df.copy()
+    stop = _get_stopwords()
     if text_col not in df.columns:
         logging.getLogger(__name__).error("text column missing: %s", text_col)
         raise KeyError(text_col)
     df[text_col] = df[text_col].fillna("").astype(str)
-    df["processed_text"] = df[text_col].apply(preprocess_text_vader)
+    # Lowercase/punctuation passes run in pandas; only the stopword filter is Python-level
+    s = df[text_col].str.lower().str.replace(_PUNCT_RE, "", regex=True)
+    df["processed_text"] = [" ".join(t for t in x.split() if t not in stop) for x in s.tolist()]
     return df
 
 # ================================================================
@@ -65,8 +62,8 @@ def df_preprocess(df: pd.DataFrame, text_col: str = "text") -> pd.DataFrame:
 #       https://docs.python.org/3/library/argparse.html
 #       https://realpython.com/command-line-interfaces-python-argparse/
 #   Note:
-#       This doesn't follow DRY principle so each file can be run independently
-#       Allows for standalone execution for testing and modular use
+#       Each file keeps its own CLI so it can be run on its own for testing
+#       and modular use; they only share logging setup (logging_setup.py)
 # ================================================================
 if __name__ == "__main__":
     import argparse
@@ -92,16 +89,23 @@ if __name__ == "__main__":
     logger = logging.getLogger("preprocess")
 
     try:
+        if not Path(args.input).exists():
+            raise FileNotFoundError(args.input)
         if args.input_format == "jsonl":
-            rows = []
-            with Path(args.input).open("r", encoding="utf-8") as f:
-                for i, line in enumerate(f, 1):
-                    try:
-                        rows.append(json.loads(line))
-                    except Exception:
-                        logger.warning("skipping invalid json line %d", i)
-                        continue
-            df = pd.DataFrame(rows)
+            try:
+                df = pd.read_json(args.input, lines=True, dtype=False, convert_dates=False, precise_float=True)
+            except ValueError:
+                # Malformed lines: re-read one at a time so they can be skipped and logged
+                logger.warning("pandas could not parse %s; falling back to line-by-line read", args.input)
+                rows = []
+                with Path(args.input).open("r", encoding="utf-8") as f:
+                    for i, line in enumerate(f, 1):
+                        try:
+                            rows.append(json.loads(line))
+                        except Exception:
+                            logger.warning("skipping invalid json line %d", i)
+                            continue
+                df = pd.DataFrame(rows)
         else:
             df = pd.read_csv(args.input)
         logger.info("loaded %d rows for preprocessing", len(df))
@@ -2,32 +2,13 @@
 #   visualise.py
 # ================================================================
 
+import sys
 from pathlib import Path
 import logging
 import pandas as pd
-import matplotlib.pyplot as plt
-import matplotlib.dates as mdates
-import seaborn as sns
 import numpy as np
 
-# ================================================================
-#   Logging helper
-# ================================================================
-def setup_logging(output_dir: Path, logs_dir: Path = None, level=logging.INFO):
-    out_dir = Path(output_dir)
-    out_dir.mkdir(parents=True, exist_ok=True)
-    if logs_dir is None:
-        logs_dir = out_dir / "logs"
-    logs_dir = Path(logs_dir)
-    logs_dir.mkdir(parents=True, exist_ok=True)
-    log_file = logs_dir / "pipeline.log"
-    handlers = [logging.FileHandler(log_file, encoding="utf-8"), logging.StreamHandler()]
-    logging.basicConfig(level=level, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s", handlers=handlers)
-
-# ================================================================
-#   Seaborn theme
-# ================================================================
-sns.set_theme(style="whitegrid")
+from logging_setup import setup_logging
 
 # ================================================================
 #   Visuals
@@ -35,8 +16,25 @@ sns.set_theme(style="whitegrid")
 #   Sentiment Distribution (Count Plot)
 #   Average Sentiment Scores by Label
 #   Pie chart
+#   Note:
+#       matplotlib/seaborn are imported inside each function so that
+#       importing this module (e.g. from main.py) stays cheap
 # ================================================================
+PLOT_DPI = 90
+
+# Plots are only ever written to file, so use the non-GUI Agg backend, but
+# only if pyplot isn't loaded yet: a caller (e.g. a notebook) that already
+# chose a backend keeps it and its open figures
+def _pyplot():
+    if "matplotlib.pyplot" not in sys.modules:
+        import matplotlib
+        matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    return plt
+
 def save_line(plot_data: pd.DataFrame, out_path: Path):
+    plt = _pyplot()
+    import matplotlib.dates as mdates
     plt.figure(figsize=(12,6))
     plt.plot(plot_data["timestamp"], plot_data["compound"], marker="o", linewidth=2, markersize=6, alpha=0.8)
     plt.axhline(y=0, color="r", linestyle="--", alpha=0.3, label="Neutral Line")
@@ -46,32 +44,39 @@ def save_line(plot_data: pd.DataFrame, out_path: Path):
     plt.ylabel("Compound Sentiment Score")
     plt.xticks(rotation=45)
     plt.tight_layout()
-    plt.savefig(out_path)
+    plt.savefig(out_path, dpi=PLOT_DPI)
     plt.close()
 
-def save_count(df: pd.DataFrame, out_path: Path):
+def save_count(counts: pd.Series, out_path: Path):
+    plt = _pyplot()
+    import seaborn as sns
     plt.figure(figsize=(6,4))
-    sns.countplot(x="sentiment", data=df, hue="sentiment", palette="pastel",
-                  order=["Positive","Neutral","Negative"], legend=False)
+    # Named columns so the axes are labelled "sentiment"/"count" like countplot did
+    count_df = counts.rename_axis("sentiment").reset_index(name="count")
+    count_df["sentiment"] = count_df["sentiment"].astype(str)
+    sns.barplot(x="sentiment", y="count", data=count_df, hue="sentiment", palette="pastel",
+                order=["Positive","Neutral","Negative"], legend=False)
     plt.title("Sentiment Distribution (Count Plot)")
     plt.tight_layout()
-    plt.savefig(out_path)
+    plt.savefig(out_path, dpi=PLOT_DPI)
     plt.close()
 
-def save_bar_avg(df: pd.DataFrame, out_path: Path):
-    avg_scores = df.groupby("sentiment")[["neg","neu","pos"]].mean().reset_index()
+def save_bar_avg(means: pd.DataFrame, out_path: Path):
+    plt = _pyplot()
+    import seaborn as sns
+    avg_scores = means.reset_index()
     avg_melt = avg_scores.melt(id_vars="sentiment", value_vars=["neg","neu","pos"], var_name="Score Type", value_name="Average")
     plt.figure(figsize=(7,4))
     sns.barplot(x="sentiment", y="Average", hue="Score Type", data=avg_melt, palette="muted")
     plt.title("Average Sentiment Scores by Label")
     plt.tight_layout()
-    plt.savefig(out_path)
+    plt.savefig(out_path, dpi=PLOT_DPI)
     plt.close()
 
-def save_pie(df: pd.DataFrame, out_path: Path):
+def save_pie(counts: pd.Series, out_path: Path):
+    plt = _pyplot()
     logger = logging.getLogger(__name__)
-    sentiment_counts = df["sentiment"].value_counts().reindex(["Positive","Neutral","Negative"])
-    sentiment_counts = sentiment_counts.fillna(0).astype(float)
+    sentiment_counts = counts.astype(float)
     sizes = sentiment_counts.values
 
     if not np.isfinite(sizes).all():
@@ -85,7 +90,7 @@ def save_pie(df: pd.DataFrame, out_path: Path):
         plt.text(0.5, 0.5, "No data to display", ha="center", va="center", fontsize=12)
         plt.axis("off")
         plt.tight_layout()
-        plt.savefig(out_path)
+        plt.savefig(out_path, dpi=PLOT_DPI)
         plt.close()
         return
 
@@ -95,13 +100,15 @@ def save_pie(df: pd.DataFrame, out_path: Path):
     plt.title("Sentiment Distribution (Pie Chart)")
     plt.axis("equal")
     plt.tight_layout()
-    plt.savefig(out_path)
+    plt.savefig(out_path, dpi=PLOT_DPI)
     plt.close()
 
 # ================================================================
 #   Run all visualisations (public)
 # ================================================================
 def run_visualisations(df: pd.DataFrame, out_dir: Path):
+    import seaborn as sns
+    sns.set_theme(style="whitegrid")
     out_dir = Path(out_dir)
     out_dir.mkdir(parents=True, exist_ok=True)
     logger = logging.getLogger(__name__)
@@ -112,17 +119,24 @@ def run_visualisations(df: pd.DataFrame, out_dir: Path):
         logger.error("Analysed DataFrame is missing required columns: %s", missing)
         raise KeyError(f"Missing required columns for visualisation: {missing}")
 
-    plot_df = df.copy()
-    plot_df["timestamp"] = pd.to_datetime(plot_df["timestamp"], errors="coerce")
+    # Only the line plot needs these two columns, so don't copy the whole frame
+    plot_df = pd.DataFrame({"timestamp": pd.to_datetime(df["timestamp"], errors="coerce"), "compound": df["compound"]})
     if plot_df["timestamp"].isna().all():
         logger.warning("All timestamps are invalid; line plot will use index instead.")
         plot_df["timestamp"] = plot_df.index
 
     try:
+        # Aggregate once here; the plot functions only render
+        counts = df["sentiment"].value_counts().reindex(["Positive","Neutral","Negative"]).fillna(0).astype(int)
+        means = df.groupby("sentiment", observed=True)[["neg","neu","pos"]].mean()
+        # Plain (sorted) labels: a CategoricalIndex would make seaborn draw empty
+        # categories too, and object-dtype input has always plotted alphabetically
+        means.index = means.index.astype(str)
+        means = means.sort_index()
         save_line(plot_df, out_dir / "sentiment_overtime.png")
-        save_count(df, out_dir / "sentiment_distribution_count.png")
-        save_bar_avg(df, out_dir / "average_sentiment_scores.png")
-        save_pie(df, out_dir / "sentiment_distribution_pie.png")
+        save_count(counts, out_dir / "sentiment_distribution_count.png")
+        save_bar_avg(means, out_dir / "average_sentiment_scores.png")
+        save_pie(counts, out_dir / "sentiment_distribution_pie.png")
         logger.info("saved plots to %s", out_dir)
     except Exception:
         logger.exception("Failed while generating visualisations")
@@ -134,8 +148,8 @@ def run_visualisations(df: pd.DataFrame, out_dir: Path):
 #       https://docs.python.org/3/library/argparse.html
 #       https://realpython.com/command-line-interfaces-python-argparse/
 #   Note:
-#       This doesn't follow DRY principle so each file can be run independently
-#       Allows for standalone execution for testing and modular use
+#       Each file keeps its own CLI so it can be run on its own for testing
+#       and modular use; they only share logging setup (logging_setup.py)
 # ================================================================
 if __name__ == "__main__":
     import argparse